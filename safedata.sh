@@ -115,7 +115,7 @@ fi
 
 log() {
   local MESSAGE="$1"
-  echo "$(date +"%Y-%m-%d %H:%M:%S") : ${MESSAGE}" | tee -a "${LOG_FILE}" | logger -t safedata
+  printf '%(%Y-%m-%d %H:%M:%S)T : %s\n' -1 "${MESSAGE}" | tee -a "${LOG_FILE}" | logger -t safedata
 }
 
 cleanup() {
@@ -144,21 +144,26 @@ cleanup() {
 trap cleanup EXIT
 
 # Detect mode based on filename pattern (must be after log function is defined)
-RULES_BASENAME=$(basename "$RULES_FILE")
-if [[ "$RULES_BASENAME" == *_include.rules ]] || [[ "$RULES_BASENAME" == *_included.rules ]] || [[ "$RULES_BASENAME" == "included.rules" ]]; then
-  RULES_MODE="include"
-  log "Detected INCLUDE mode from filename: $RULES_BASENAME"
-elif [[ "$RULES_BASENAME" == *_exclude.rules ]] || [[ "$RULES_BASENAME" == *_excluded.rules ]] || [[ "$RULES_BASENAME" == "excluded.rules" ]]; then
-  RULES_MODE="exclude"
-  log "Detected EXCLUDE mode from filename: $RULES_BASENAME"
-elif [[ "$RULES_BASENAME" == *_all.rules ]] || [[ "$RULES_BASENAME" == "all.rules" ]]; then
-  RULES_MODE="all"
-  log "Detected ALL mode from filename: $RULES_BASENAME"
-else
-  echo "ERROR: Cannot detect rules mode from filename: $RULES_BASENAME"
-  echo "Filename must end with: _include.rules, _included.rules, _exclude.rules, _excluded.rules, or _all.rules"
-  usage
-fi
+RULES_BASENAME="${RULES_FILE##*/}"
+case "$RULES_BASENAME" in
+  *_include.rules|*_included.rules|included.rules)
+    RULES_MODE="include"
+    log "Detected INCLUDE mode from filename: $RULES_BASENAME"
+    ;;
+  *_exclude.rules|*_excluded.rules|excluded.rules)
+    RULES_MODE="exclude"
+    log "Detected EXCLUDE mode from filename: $RULES_BASENAME"
+    ;;
+  *_all.rules|all.rules)
+    RULES_MODE="all"
+    log "Detected ALL mode from filename: $RULES_BASENAME"
+    ;;
+  *)
+    echo "ERROR: Cannot detect rules mode from filename: $RULES_BASENAME"
+    echo "Filename must end with: _include.rules, _included.rules, _exclude.rules, _excluded.rules, or _all.rules"
+    usage
+    ;;
+esac
 
 # Function to build rsync arguments based on rules mode
 build_rsync_args() {
@@ -180,16 +185,17 @@ build_rsync_args() {
     # Collect patterns and parent directories
     while IFS= read -r line || [[ -n "$line" ]]; do
       [[ -z "$line" || "$line" =~ ^[[:space:]]*# ]] && continue
-      line=$(echo "$line" | sed 's/^[[:space:]]*//;s/[[:space:]]*$//')
+      # Trim surrounding whitespace
+      line="${line#"${line%%[![:space:]]*}"}"
+      line="${line%"${line##*[![:space:]]}"}"
       
-      # Extract parent directories
-      if [[ "$line" == */* ]]; then
-        local parent=$(dirname "$line")
-        while [[ "$parent" != "." ]]; do
-          parent_dirs["$parent/"]=1
-          parent=$(dirname "$parent")
-        done
-      fi
+      # Extract parent directories (trailing slash dropped first, as dirname does)
+      local parent="${line%/}"
+      while [[ "$parent" == */* ]]; do
+        parent="${parent%/*}"
+        [ -n "$parent" ] || break
+        parent_dirs["$parent/"]=1
+      done
       
       include_patterns+=("$line")
     done < "$rules_file"
@@ -239,7 +245,10 @@ build_tar_args() {
     local include_items=""
     while IFS= read -r line || [[ -n "$line" ]]; do
       [[ -z "$line" || "$line" =~ ^[[:space:]]*# ]] && continue
-      line=$(echo "$line" | sed 's/^[[:space:]]*//;s/[[:space:]]*$//;s|^/||')
+      # Trim surrounding whitespace and a leading slash
+      line="${line#"${line%%[![:space:]]*}"}"
+      line="${line%"${line##*[![:space:]]}"}"
+      line="${line#/}"
       include_items="${include_items} ./${line}"
     done < "$rules_file"
     
@@ -254,16 +263,17 @@ build_tar_args() {
 
 log "==================== Starting SafeData Backup ===================="
 
-# Start time measurement
-START_TIME=$(date +%s)
+# Start time measurement (bash's SECONDS counts up from the value assigned here)
+SECONDS=0
 
 # Start progress indicator window
 VOLUMES_LIST=$(printf "%s " "${VOLUMES[@]}")
 ZENITY_PID=""
 if [ -n "${SUDO_USER:-}" ]; then
-  # Get user's DBUS session and DISPLAY
-  DBUS_ADDRESS=$(ps -u "${SUDO_USER}" e 2>/dev/null | grep -o 'DBUS_SESSION_BUS_ADDRESS=[^ ]*' | head -n1 | cut -d= -f2- || echo "")
-  USER_DISPLAY=$(ps -u "${SUDO_USER}" e 2>/dev/null | grep -o 'DISPLAY=[^ ]*' | head -n1 | cut -d= -f2- || echo "")
+  # Get user's DBUS session and DISPLAY (process list is read only once)
+  USER_PROC_ENV=$(ps -u "${SUDO_USER}" e 2>/dev/null || echo "")
+  DBUS_ADDRESS=$(grep -o 'DBUS_SESSION_BUS_ADDRESS=[^ ]*' <<< "${USER_PROC_ENV}" | head -n1 | cut -d= -f2- || echo "")
+  USER_DISPLAY=$(grep -o 'DISPLAY=[^ ]*' <<< "${USER_PROC_ENV}" | head -n1 | cut -d= -f2- || echo "")
   
   if [ -n "$DBUS_ADDRESS" ] && [ -n "$USER_DISPLAY" ]; then
     # Start zenity progress dialog
@@ -289,9 +299,27 @@ if [ -n "${SUDO_USER:-}" ]; then
   fi
 fi
 
+# Variables used by cleanup() must exist before the first volume is processed
+SNAP_NAME=""
+SNAP_DEV=""
+MNT_DIR=""
+
+# Rules do not change between volumes, so build the transfer arguments once
+if [[ "${BACKUP_METHOD}" == *tar ]]; then
+  if [ "$RULES_MODE" == "include" ]; then
+    TAR_ARGS=$(build_tar_args "include" "${RULES_PATH}")
+  else
+    TAR_ARGS=$(build_tar_args "exclude" "${RULES_PATH}")
+  fi
+  echo "TAR_ARGS: ${TAR_ARGS}"
+else
+  RSYNC_ARGS=$(build_rsync_args "${RULES_MODE}" "${RULES_PATH}")
+  echo "RSYNC_ARGS: ${RSYNC_ARGS}"
+fi
+
 # Main backup loop
 for VOL in "${VOLUMES[@]}"; do
-  TIMESTAMP=$(date +"%Y%m%d_%H%M%S")
+  printf -v TIMESTAMP '%(%Y%m%d_%H%M%S)T' -1
   SNAP_NAME="snap_${VOL}_${TIMESTAMP}"
   SNAP_DEV="/dev/${VG_NAME}/${SNAP_NAME}"
   ORIG_DEV="/dev/${VG_NAME}/${VOL}"
@@ -312,14 +340,6 @@ for VOL in "${VOLUMES[@]}"; do
     if [ "${BACKUP_METHOD}" == "folder_tar" ]; then
       log "Starting tar backup for folder ${SRC_DIR}"
       
-      if [ "$RULES_MODE" == "include" ]; then
-        TAR_ARGS=$(build_tar_args "include" "${RULES_PATH}")
-      else
-        TAR_ARGS=$(build_tar_args "exclude" "${RULES_PATH}")
-      fi
-      
-      echo "TAR_ARGS: ${TAR_ARGS}"
-      
       # Handle root directory specially
       DIR_NAME=$(basename "${SRC_DIR}")
       if [ "${DIR_NAME}" == "/" ] || [ "${SRC_DIR}" == "/" ]; then
@@ -336,9 +356,6 @@ for VOL in "${VOLUMES[@]}"; do
     else # folder_rsync
       log "Starting rsync backup for folder ${SRC_DIR}"
       
-      RSYNC_ARGS=$(build_rsync_args "${RULES_MODE}" "${RULES_PATH}")
-      echo "RSYNC_ARGS: ${RSYNC_ARGS}"
-      
       # Handle root directory specially
       DIR_NAME=$(basename "${SRC_DIR}")
       if [ "${DIR_NAME}" == "/" ] || [ "${SRC_DIR}" == "/" ]; then
@@ -374,14 +391,6 @@ for VOL in "${VOLUMES[@]}"; do
   if [ "${BACKUP_METHOD}" == "tar" ]; then
     log "Starting tar backup for ${VOL}"
     
-    if [ "$RULES_MODE" == "include" ]; then
-      TAR_ARGS=$(build_tar_args "include" "${RULES_PATH}")
-    else
-      TAR_ARGS=$(build_tar_args "exclude" "${RULES_PATH}")
-    fi
-    
-    echo "TAR_ARGS: ${TAR_ARGS}"
-    
     if tar cvpz -C "${MNT_DIR}" ${TAR_ARGS} | ssh -i ~/.ssh/id_rsa_backupagent -p ${SSH_PORT} ${REMOTE_SSH_USER}@${REMOTE_SSH_HOST} "cat > ${REMOTE_BASE_DIR}/$(hostname)_${VOL}_${TIMESTAMP}.tar.gz"; then
       log "Tar backup completed successfully for ${VOL}"
     else
@@ -393,9 +402,6 @@ for VOL in "${VOLUMES[@]}"; do
   elif [ "${BACKUP_METHOD}" == "rsync_notimestamp" ]; then
     log "Starting rsync_notimestamp for ${VOL}"
     
-    RSYNC_ARGS=$(build_rsync_args "${RULES_MODE}" "${RULES_PATH}")
-    echo "RSYNC_ARGS: ${RSYNC_ARGS}"
-    
     if rsync -azl ${RSYNC_ARGS} -e "ssh -p ${SSH_PORT}" -v "${MNT_DIR}/" "${REMOTE_SSH_USER}@${REMOTE_SSH_HOST}:${REMOTE_BASE_DIR}/${VOL}/"; then
       log "Rsync_notimestamp backup completed successfully for ${VOL}"
     else
@@ -407,9 +413,6 @@ for VOL in "${VOLUMES[@]}"; do
   elif [ "${BACKUP_METHOD}" == "rsync" ]; then
     log "Starting rsync for ${VOL}"
     
-    RSYNC_ARGS=$(build_rsync_args "${RULES_MODE}" "${RULES_PATH}")
-    echo "RSYNC_ARGS: ${RSYNC_ARGS}"
-    
     if rsync -azl ${RSYNC_ARGS} -e "ssh -p ${SSH_PORT}" -v "${MNT_DIR}/" "${REMOTE_SSH_USER}@${REMOTE_SSH_HOST}:${REMOTE_BASE_DIR}/${VOL}_${TIMESTAMP}/"; then
       log "Rsync backup completed successfully for ${VOL}"
     else
@@ -427,18 +430,17 @@ done
 trap - EXIT
 
 # Calculate and display elapsed time
-END_TIME=$(date +%s)
-ELAPSED_TIME=$((END_TIME - START_TIME))
+ELAPSED_TIME=${SECONDS}
 HOURS=$((ELAPSED_TIME / 3600))
 MINUTES=$(((ELAPSED_TIME % 3600) / 60))
-SECONDS=$((ELAPSED_TIME % 60))
+SECS=$((ELAPSED_TIME % 60))
 
 if [ $HOURS -gt 0 ]; then
-  TIME_MSG=$(printf "%dh %dm %ds" $HOURS $MINUTES $SECONDS)
+  printf -v TIME_MSG "%dh %dm %ds" $HOURS $MINUTES $SECS
 elif [ $MINUTES -gt 0 ]; then
-  TIME_MSG=$(printf "%dm %ds" $MINUTES $SECONDS)
+  printf -v TIME_MSG "%dm %ds" $MINUTES $SECS
 else
-  TIME_MSG=$(printf "%ds" $SECONDS)
+  printf -v TIME_MSG "%ds" $SECS
 fi
 
 log "All backups completed successfully (elapsed time: ${TIME_MSG})"
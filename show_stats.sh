@@ -43,42 +43,67 @@ fi
 extract_stats() {
     local output_file="$1"
     
+    # Line patterns, matched with bash's =~ instead of spawning grep/tr per field;
+    # capture groups pull every field out of the match that validates the line
+    local sent_re='^sent ([0-9.]+) bytes.*received ([0-9.]+) bytes( +([0-9.]+),([0-9]+) bytes/sec)?'
+    local total_re='^total size is ([0-9.]+)( +speedup is ([0-9.]+),([0-9]+))?'
+    local elapsed_re='elapsed time: ([0-9]+)'
+    
     # Initialize CSV with header
     echo "timestamp,date,time,sent_bytes,received_bytes,speed_bytes_sec,total_size,speedup,elapsed_sec,log_file" > "$output_file"
     
-    # Process all safedata*.log files
+    local records=0
+    local log_file filename date time timestamp stats_line total_line elapsed_line
+    local sent received speed total_size speedup elapsed
+    
+    # Process all safedata*.log files (output file is opened once for the whole loop)
     for log_file in "$LOGS_DIR"/safedata*.log; do
         [ -f "$log_file" ] || continue
         
         # Extract timestamp from filename
-        filename=$(basename "$log_file")
+        filename="${log_file##*/}"
         if [[ $filename =~ safedata(_shared)?_([0-9]{4}-[0-9]{2}-[0-9]{2})_([0-9]{2}-[0-9]{2}-[0-9]{2})\.log ]]; then
             date="${BASH_REMATCH[2]}"
             time="${BASH_REMATCH[3]//-/:}"
             timestamp="${date} ${time}"
             
-            # Extract rsync statistics
-            stats_line=$(grep -E "^sent [0-9.]+ bytes.*received [0-9.]+ bytes" "$log_file" 2>/dev/null)
+            # Pick up the rsync statistics and elapsed time lines in one pass over the log
+            stats_line="" total_line="" elapsed_line=""
+            {
+                IFS= read -r stats_line
+                IFS= read -r total_line
+                IFS= read -r elapsed_line
+            } < <(awk '
+                sent == "" && /^sent [0-9.]+ bytes.*received [0-9.]+ bytes/ { sent = $0 }
+                total == "" && /^total size is/ { total = $0 }
+                elapsed == "" && /elapsed time:/ { elapsed = $0 }
+                sent != "" && total != "" && elapsed != "" { exit }
+                END { print sent; print total; print elapsed }
+            ' "$log_file" 2>/dev/null)
+            
             if [ -n "$stats_line" ]; then
-                sent=$(echo "$stats_line" | grep -oP 'sent \K[0-9.]+' | tr -d '.')
-                received=$(echo "$stats_line" | grep -oP 'received \K[0-9.]+' | tr -d '.')
-                speed_raw=$(echo "$stats_line" | grep -oP '[0-9.]+,[0-9]+ bytes/sec')
-                speed=$(echo "$speed_raw" | tr -d '.' | tr ',' '.' | grep -oP '^[0-9.]+')
+                sent="" received="" speed="" total_size="" speedup="" elapsed=""
                 
-                total_line=$(grep -E "^total size is" "$log_file" 2>/dev/null)
-                total_size=$(echo "$total_line" | grep -oP 'total size is \K[0-9.]+' | tr -d '.')
-                speedup_raw=$(echo "$total_line" | grep -oP 'speedup is \K[0-9.]+,[0-9]+')
-                speedup=$(echo "$speedup_raw" | tr -d '.' | tr ',' '.')
+                # Thousands separators are dots, decimal separator is a comma
+                if [[ $stats_line =~ $sent_re ]]; then
+                    sent="${BASH_REMATCH[1]//./}"
+                    received="${BASH_REMATCH[2]//./}"
+                    [ -n "${BASH_REMATCH[3]}" ] && speed="${BASH_REMATCH[4]//./}.${BASH_REMATCH[5]}"
+                fi
                 
-                elapsed_line=$(grep -E "elapsed time:" "$log_file" 2>/dev/null)
-                elapsed=$(echo "$elapsed_line" | grep -oP 'elapsed time: \K[0-9]+')
+                if [[ $total_line =~ $total_re ]]; then
+                    total_size="${BASH_REMATCH[1]//./}"
+                    [ -n "${BASH_REMATCH[2]}" ] && speedup="${BASH_REMATCH[3]//./}.${BASH_REMATCH[4]}"
+                fi
                 
-                echo "$timestamp,$date,$time,$sent,$received,$speed,$total_size,$speedup,$elapsed,$filename" >> "$output_file"
+                [[ $elapsed_line =~ $elapsed_re ]] && elapsed="${BASH_REMATCH[1]}"
+                
+                echo "$timestamp,$date,$time,$sent,$received,$speed,$total_size,$speedup,$elapsed,$filename"
+                records=$((records + 1))
             fi
         fi
-    done
+    done >> "$output_file"
     
-    local records=$(( $(wc -l < "$output_file") - 1 ))
     echo "Extracted $records backup records"
 }
 
@@ -86,9 +111,9 @@ extract_stats() {
 needs_update() {
     [ ! -f "$STATS_FILE" ] && return 0
     
-    local newest_log=$(find "$LOGS_DIR" -name "safedata*.log" -type f -printf '%T@ %p\n' 2>/dev/null | sort -rn | head -1 | cut -d' ' -f2-)
-    [ -z "$newest_log" ] && return 1
-    [ "$newest_log" -nt "$STATS_FILE" ] && return 0
+    # Stop at the first log newer than the stats file instead of sorting all of them
+    local newer_log=$(find "$LOGS_DIR" -name "safedata*.log" -type f -newer "$STATS_FILE" -print -quit 2>/dev/null)
+    [ -n "$newer_log" ] && return 0
     
     return 1
 }
@@ -108,53 +133,45 @@ show_graph() {
     local height="${4:-12}"
     
     echo -e "\n${color}=== $title ===${COLOR_RESET}"
-    tail -n +2 "$STATS_FILE" | cut -d',' -f"$column" | python3 "$UCHART" -y "$height" -n "$title"
+    awk -F',' -v column="$column" 'NR > 1 { print $column }' "$STATS_FILE" | python3 "$UCHART" -y "$height" -n "$title"
 }
 
 show_summary() {
     echo -e "\n=== Summary Statistics ==="
-    local total_backups=$(( $(wc -l < "$STATS_FILE") - 1 ))
+    local total_backups=$TOTAL_RECORDS
     echo "Total backups: $total_backups"
     
     if [ $total_backups -gt 0 ]; then
-        echo ""
-        echo "Sent bytes:"
-        tail -n +2 "$STATS_FILE" | cut -d',' -f4 | awk '{
-            sum+=$1; 
-            if(NR==1){min=max=$1} 
-            if($1<min){min=$1} 
-            if($1>max){max=$1}
-        } END {
-            printf "  Min: %'\''d bytes (%.2f MB)\n", min, min/1024/1024
-            printf "  Max: %'\''d bytes (%.2f MB)\n", max, max/1024/1024
-            printf "  Avg: %'\''d bytes (%.2f MB)\n", sum/NR, sum/NR/1024/1024
-        }'
-        
-        echo ""
-        echo "Transfer speed:"
-        tail -n +2 "$STATS_FILE" | cut -d',' -f6 | awk '{
-            sum+=$1;
-            if(NR==1){min=max=$1}
-            if($1<min){min=$1}
-            if($1>max){max=$1}
-        } END {
-            printf "  Min: %'\''d bytes/sec (%.2f MB/s)\n", min, min/1024/1024
-            printf "  Max: %'\''d bytes/sec (%.2f MB/s)\n", max, max/1024/1024
-            printf "  Avg: %'\''d bytes/sec (%.2f MB/s)\n", sum/NR, sum/NR/1024/1024
-        }'
-        
-        echo ""
-        echo "Elapsed time:"
-        tail -n +2 "$STATS_FILE" | cut -d',' -f9 | awk '{
-            sum+=$1;
-            if(NR==1){min=max=$1}
-            if($1<min){min=$1}
-            if($1>max){max=$1}
+        # Single pass over the CSV: sent bytes ($4), speed ($6), elapsed time ($9)
+        awk -F',' 'NR > 1 {
+            n++
+            sent_sum+=$4; speed_sum+=$6; time_sum+=$9
+            if(n==1){sent_min=sent_max=$4; speed_min=speed_max=$6; time_min=time_max=$9}
+            if($4<sent_min){sent_min=$4}
+            if($4>sent_max){sent_max=$4}
+            if($6<speed_min){speed_min=$6}
+            if($6>speed_max){speed_max=$6}
+            if($9<time_min){time_min=$9}
+            if($9>time_max){time_max=$9}
         } END {
-            printf "  Min: %d seconds\n", min
-            printf "  Max: %d seconds\n", max
-            printf "  Avg: %.1f seconds\n", sum/NR
-        }'
+            print ""
+            print "Sent bytes:"
+            printf "  Min: %'\''d bytes (%.2f MB)\n", sent_min, sent_min/1024/1024
+            printf "  Max: %'\''d bytes (%.2f MB)\n", sent_max, sent_max/1024/1024
+            printf "  Avg: %'\''d bytes (%.2f MB)\n", sent_sum/n, sent_sum/n/1024/1024
+            
+            print ""
+            print "Transfer speed:"
+            printf "  Min: %'\''d bytes/sec (%.2f MB/s)\n", speed_min, speed_min/1024/1024
+            printf "  Max: %'\''d bytes/sec (%.2f MB/s)\n", speed_max, speed_max/1024/1024
+            printf "  Avg: %'\''d bytes/sec (%.2f MB/s)\n", speed_sum/n, speed_sum/n/1024/1024
+            
+            print ""
+            print "Elapsed time:"
+            printf "  Min: %d seconds\n", time_min
+            printf "  Max: %d seconds\n", time_max
+            printf "  Avg: %.1f seconds\n", time_sum/n
+        }' "$STATS_FILE"
     fi
 }
 
@@ -169,8 +186,10 @@ if needs_update; then
     echo ""
 fi
 
-# Check if we have data
-if [ ! -f "$STATS_FILE" ] || [ $(wc -l < "$STATS_FILE") -le 1 ]; then
+# Check if we have data (record count is reused by show_summary)
+TOTAL_RECORDS=0
+[ -f "$STATS_FILE" ] && TOTAL_RECORDS=$(( $(wc -l < "$STATS_FILE") - 1 ))
+if [ $TOTAL_RECORDS -le 0 ]; then
     echo "No backup statistics found in $LOGS_DIR"
     exit 1
 fi